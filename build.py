@@ -8,181 +8,403 @@ import os
 import sys
 import subprocess
 import shutil
-import platform
+import types
+import hashlib
+import threading
+import time
+import atexit
+import importlib.util
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-def get_platform_info():
-    """Get platform-specific information"""
-    system = platform.system().lower()
-    
-    if system == "windows":
-        return {
-            "name": "Windows",
-            "exe_extension": ".exe",
-            "data_separator": ";",
-            "script_extension": ".bat",
-            "script_template": """@echo off
+# Files whose content decides whether PyInstaller's build/ folder can be reused
+BUILD_INPUTS = ["missing_file_scanner.py", "requirements.txt"]
+INPUTS_HASH_FILE = os.path.join("build", ".inputs_hash")
+
+# Platform-specific information, resolved once at import time
+_WIN_INFO = types.SimpleNamespace(
+    name="Windows",
+    exe_extension=".exe",
+    data_separator=";",
+    script_extension=".bat",
+    script_content="""@echo off
 echo Starting Missing File Scanner...
-MissingFileScanner{exe_ext}
+MissingFileScanner.exe
 pause
 """,
-            "icon": "📊"
-        }
-    elif system == "darwin":  # macOS
-        return {
-            "name": "macOS",
-            "exe_extension": "",
-            "data_separator": ":",
-            "script_extension": ".command",
-            "script_template": """#!/bin/bash
+    icon="📊"
+)
+
+_MAC_INFO = types.SimpleNamespace(
+    name="macOS",
+    exe_extension="",
+    data_separator=":",
+    script_extension=".command",
+    script_content="""#!/bin/bash
 echo "Starting Missing File Scanner..."
-./MissingFileScanner{exe_ext}
+./MissingFileScanner
 read -p "Press any key to continue..."
 """,
-            "icon": "🍎"
-        }
-    else:  # Linux and other Unix-like systems
-        return {
-            "name": "Linux",
-            "exe_extension": "",
-            "data_separator": ":",
-            "script_extension": ".sh",
-            "script_template": """#!/bin/bash
+    icon="🍎"
+)
+
+# Linux and other Unix-like systems
+_LINUX_INFO = types.SimpleNamespace(
+    name="Linux",
+    exe_extension="",
+    data_separator=":",
+    script_extension=".sh",
+    script_content="""#!/bin/bash
 echo "Starting Missing File Scanner..."
-./MissingFileScanner{exe_ext}
+./MissingFileScanner
 read -p "Press any key to continue..."
 """,
-            "icon": "🐧"
-        }
+    icon="🐧"
+)
+
+PLATFORM_INFO = (_WIN_INFO if os.name == "nt"
+                 else _MAC_INFO if sys.platform == "darwin"
+                 else _LINUX_INFO)
+
+# Interpreter used for pip and PyInstaller subprocesses
+_PY = sys.executable
+
+# PyInstaller options shared by every platform
+_PYI_FIXED_ARGS = (
+    "--onefile",                    # Create a single executable file
+    "--windowed",                   # Hide console window (GUI app)
+    "--name=MissingFileScanner",    # Name of the executable
+    "--icon=NONE",                  # No icon (can be added later)
+    "--distpath=dist",              # Output directory
+    "--workpath=build",             # Build directory
+    "--specpath=.",                 # Spec file location
+    "--noupx",                      # UPX slows down startup decompression
+    # Keep unused stdlib packages out of the bundle
+    "--exclude-module=tkinter",
+    "--exclude-module=unittest",
+    "--exclude-module=pydoc_data",
+    "--exclude-module=test",
+    "--exclude-module=distutils",
+)
+
+def get_platform_info():
+    """Get platform-specific information"""
+    return PLATFORM_INFO
+
+def _popen_kwargs():
+    """Extra subprocess arguments that keep Windows from spawning a console per child"""
+    if sys.platform == "win32":
+        return {"creationflags": subprocess.CREATE_NO_WINDOW}
+    return {}
 
 def check_pyinstaller():
     """Check if PyInstaller is installed, install if not"""
-    try:
-        import PyInstaller
+    # find_spec locates the package without running its __init__
+    if importlib.util.find_spec("PyInstaller") is not None:
         print("✅ PyInstaller is already installed")
         return True
-    except ImportError:
-        print("❌ PyInstaller not found. Installing...")
-        try:
-            subprocess.check_call([sys.executable, "-m", "pip", "install", "pyinstaller"])
-            print("✅ PyInstaller installed successfully")
-            return True
-        except subprocess.CalledProcessError:
-            print("❌ Failed to install PyInstaller")
-            return False
+    
+    print("❌ PyInstaller not found. Installing...")
+    try:
+        subprocess.check_call([_PY, "-m", "pip", "install", "pyinstaller"],
+                              **_popen_kwargs())
+        print("✅ PyInstaller installed successfully")
+        return True
+    except subprocess.CalledProcessError:
+        print("❌ Failed to install PyInstaller")
+        return False
+
+def _pyinstaller_command():
+    """Build the PyInstaller command line for the current platform"""
+    platform_info = get_platform_info()
+    
+    cmd = [
+        _PY, "-m", "PyInstaller",
+        *_PYI_FIXED_ARGS,
+        f"--add-data=requirements.txt{platform_info.data_separator}.", # Include requirements.txt with correct separator
+        "missing_file_scanner.py"       # Main script
+    ]
+    if platform_info.exe_extension == "":
+        cmd.insert(-1, "--strip")       # Strip symbols from binaries on Unix-like systems
+    return cmd
+
+def _build_inputs_hash(cmd):
+    """Hash the build inputs that decide whether PyInstaller's work folder is reusable"""
+    digest = hashlib.sha256()
+    for file_name in BUILD_INPUTS:
+        if os.path.exists(file_name):
+            with open(file_name, "rb") as f:
+                digest.update(f.read())
+    digest.update("\0".join(cmd).encode())
+    return digest.hexdigest()
+
+# Background deletions started by _trash_dir, and the ones that failed
+_trash_threads = []
+_trash_failures = []  # (path, error) pairs
+
+# Folders this script moves aside or stages next to the project; leftovers
+# from an interrupted deletion are swept on the next build
+_LEFTOVER_PREFIXES = ("build.trash.", "dist.trash.", "__pycache__.trash.",
+                      "MissingFileScanner_Portable.trash.", "MissingFileScanner_Portable.staging.")
+
+def _delete_tree(path):
+    """Delete a directory tree, recording a failure instead of losing it in a thread"""
+    try:
+        shutil.rmtree(path)
+    except OSError as e:
+        _trash_failures.append((path, e))
+
+def _delete_in_background(path):
+    """Delete a directory tree on a daemon thread"""
+    thread = threading.Thread(target=_delete_tree, args=(path,), daemon=True)
+    thread.start()
+    _trash_threads.append(thread)
+
+def _trash_dir(path):
+    """Move a directory out of the way and delete it in the background
+    
+    The rename is O(1), so the build can start while the old tree is being
+    removed. Falls back to removing in place if the rename fails.
+    """
+    trash_path = f"{path}.trash.{os.getpid()}.{time.time_ns()}"
+    try:
+        os.rename(path, trash_path)
+    except OSError:
+        shutil.rmtree(path)
+        return
+    
+    _delete_in_background(trash_path)
+
+def _sweep_leftovers():
+    """Start deleting folders left behind by earlier builds"""
+    with os.scandir('.') as entries:
+        leftovers = [entry.name for entry in entries
+                     if entry.name.startswith(_LEFTOVER_PREFIXES) and entry.is_dir(follow_symlinks=False)]
+    for name in leftovers:
+        print(f"🧹 Removing leftover {name}...")
+        # Rename first, so a new folder of the same name can't collide with the deletion
+        _trash_dir(name)
+
+@atexit.register
+def _join_trash_threads(timeout=5.0):
+    """Give pending background deletions a short time to finish on exit, then report problems"""
+    deadline = time.monotonic() + timeout
+    for thread in _trash_threads:
+        thread.join(max(0.0, deadline - time.monotonic()))
+    
+    unfinished = sum(thread.is_alive() for thread in _trash_threads)
+    if unfinished:
+        print(f"⚠️ {unfinished} old folder(s) still being deleted; the next build removes what is left")
+    for path, error in _trash_failures:
+        print(f"⚠️ Could not delete {path}: {error}")
 
 def clean_build_dirs():
     """Clean previous build directories"""
+    _sweep_leftovers()
+    
     dirs_to_clean = ['build', 'dist', '__pycache__']
+    
+    # Keep PyInstaller's work folder when the inputs are unchanged since it was built
+    try:
+        with open(INPUTS_HASH_FILE) as f:
+            if f.read().strip() == _build_inputs_hash(_pyinstaller_command()):
+                print("♻️ Build inputs unchanged, reusing build directory")
+                dirs_to_clean.remove('build')
+    except OSError:
+        pass
+    
     for dir_name in dirs_to_clean:
         if os.path.exists(dir_name):
             print(f"🧹 Cleaning {dir_name} directory...")
-            shutil.rmtree(dir_name)
+            _trash_dir(dir_name)
 
-def create_executable():
-    """Create the executable using PyInstaller"""
+def create_executable(verbose=False):
+    """Create the executable using PyInstaller, echoing its log live if verbose"""
     platform_info = get_platform_info()
-    print(f"🔨 Building executable for {platform_info['name']} {platform_info['icon']}...")
+    print(f"🔨 Building executable for {platform_info.name} {platform_info.icon}...")
     
-    # PyInstaller command with options
-    cmd = [
-        sys.executable, "-m", "PyInstaller",
-        "--onefile",                    # Create a single executable file
-        "--windowed",                   # Hide console window (GUI app)
-        "--name=MissingFileScanner",    # Name of the executable
-        "--icon=NONE",                  # No icon (can be added later)
-        f"--add-data=requirements.txt{platform_info['data_separator']}.", # Include requirements.txt with correct separator
-        "--distpath=dist",              # Output directory
-        "--workpath=build",             # Build directory
-        "--specpath=.",                 # Spec file location
-        "missing_file_scanner.py"       # Main script
-    ]
+    cmd = _pyinstaller_command()
+    
+    # Bundle bytecode without asserts and docstrings
+    env = dict(os.environ, PYTHONOPTIMIZE="2")
     
     try:
-        # Run PyInstaller
-        result = subprocess.run(cmd, capture_output=True, text=True)
+        # Run PyInstaller, keeping only the tail of its log for error reporting
+        log_tail = deque(maxlen=200)
+        with subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                              text=True, bufsize=1, env=env, **_popen_kwargs()) as proc:
+            for line in proc.stderr:
+                line = line.rstrip("\n")
+                log_tail.append(line)
+                if verbose:
+                    print(line, flush=True)
+        returncode = proc.returncode
         
-        if result.returncode == 0:
+        if returncode == 0:
             print("✅ Executable created successfully!")
             
             # Check if executable exists
-            exe_name = f"MissingFileScanner{platform_info['exe_extension']}"
+            exe_name = f"MissingFileScanner{platform_info.exe_extension}"
             exe_path = Path("dist") / exe_name
             if exe_path.exists():
                 size_mb = exe_path.stat().st_size / (1024 * 1024)
                 print(f"📦 Executable location: {exe_path.absolute()}")
                 print(f"📏 File size: {size_mb:.1f} MB")
+                
+                # Record the inputs so the next build can reuse the work folder
+                with open(INPUTS_HASH_FILE, "w") as f:
+                    f.write(_build_inputs_hash(cmd))
                 return True
             else:
                 print(f"❌ Executable not found in expected location: {exe_path}")
                 return False
         else:
             print("❌ PyInstaller failed:")
-            print(result.stderr)
+            if not verbose:  # Already echoed otherwise
+                print("\n".join(log_tail))
             return False
             
     except Exception as e:
         print(f"❌ Error running PyInstaller: {e}")
         return False
 
-def create_portable_package():
-    """Create a portable package with the executable and documentation"""
-    platform_info = get_platform_info()
-    print(f"📦 Creating portable package for {platform_info['name']}...")
+def _fastcopy(src, dst):
+    """Copy a file with the OS fast-copy primitive, then its metadata
     
-    package_dir = Path("MissingFileScanner_Portable")
+    Windows uses CopyFile2 and Linux os.copy_file_range, which keeps the data
+    in the kernel. Elsewhere (e.g. macOS, where it uses fcopyfile) and on
+    filesystems copy_file_range doesn't support, shutil.copyfile is used.
+    """
+    src, dst = os.fspath(src), os.fspath(dst)
+    if sys.platform == "win32":
+        import ctypes
+        result = ctypes.windll.kernel32.CopyFile2(src, dst, None)
+        if result != 0:
+            raise OSError(f"CopyFile2 failed with HRESULT {result & 0xFFFFFFFF:#010x}: {src}")
+    else:
+        copied = False
+        if hasattr(os, "copy_file_range"):
+            with open(src, "rb", buffering=0) as fsrc, open(dst, "wb", buffering=0) as fdst:
+                try:
+                    while os.copy_file_range(fsrc.fileno(), fdst.fileno(), 1 << 30):
+                        pass
+                    copied = True
+                except OSError:
+                    pass  # e.g. unsupported filesystem - shutil.copyfile rewrites dst below
+        if not copied:
+            shutil.copyfile(src, dst)
+    shutil.copystat(src, dst)
+
+PACKAGE_DIR = Path("MissingFileScanner_Portable")
+
+def _list_working_dir():
+    """Names of the entries in the current directory, read in one scandir pass"""
+    with os.scandir('.') as entries:
+        return {entry.name for entry in entries}
+
+def _staging_package_dir():
+    """Temporary sibling folder the next portable package is assembled in"""
+    # Unique per call, since PIDs repeat across runs (e.g. PID 1 in containers)
+    return PACKAGE_DIR.with_name(f"{PACKAGE_DIR.name}.staging.{os.getpid()}.{time.time_ns()}")
+
+def _prepare_package_skeleton(package_dir, present=None):
+    """Create a package folder with documentation and launcher script
+    
+    Nothing here depends on the built executable, so it can run while
+    PyInstaller is still working. ``present`` is an optional set of names
+    already known to exist in the current directory. Progress messages are
+    returned rather than printed, so they don't interleave with the build's.
+    """
+    if present is None:
+        present = _list_working_dir()
+    platform_info = get_platform_info()
+    messages = []
     
     # Create package directory
     if package_dir.exists():
         shutil.rmtree(package_dir)
     package_dir.mkdir()
     
-    # Copy executable
-    exe_name = f"MissingFileScanner{platform_info['exe_extension']}"
-    exe_source = Path("dist") / exe_name
-    if exe_source.exists():
-        shutil.copy2(exe_source, package_dir / exe_name)
-        print(f"✅ Copied executable: {exe_name}")
-        
-        # Make executable on Unix-like systems
-        if platform_info['exe_extension'] == "":
-            os.chmod(package_dir / exe_name, 0o755)
-            print("✅ Set executable permissions")
-    
     # Copy documentation
     files_to_copy = ["README.md", "requirements.txt"]
     for file_name in files_to_copy:
-        if Path(file_name).exists():
-            shutil.copy2(file_name, package_dir / file_name)
-            print(f"✅ Copied {file_name}")
+        if file_name in present:
+            _fastcopy(file_name, package_dir / file_name)
+            messages.append(f"✅ Copied {file_name}")
     
     # Create platform-specific launcher script
-    script_name = f"Run_Scanner{platform_info['script_extension']}"
-    script_content = platform_info['script_template'].format(exe_ext=platform_info['exe_extension'])
-    
+    script_name = f"Run_Scanner{platform_info.script_extension}"
     script_path = package_dir / script_name
-    with open(script_path, "w", newline='\n') as f:
-        f.write(script_content)
+    is_executable_script = platform_info.script_extension in {'.sh', '.command'}
+    
+    # Write in one syscall; the script is made executable on Unix-like systems
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+    fd = os.open(script_path, flags, 0o644)
+    try:
+        os.write(fd, platform_info.script_content.encode("utf-8"))
+        # Set the mode explicitly; the open mode above is filtered by the umask
+        if is_executable_script:
+            os.fchmod(fd, 0o755)
+    finally:
+        os.close(fd)
     
-    # Make script executable on Unix-like systems
-    if platform_info['script_extension'] in ['.sh', '.command']:
-        os.chmod(script_path, 0o755)
-        print(f"✅ Created executable launcher script: {script_name}")
+    if is_executable_script:
+        messages.append(f"✅ Created executable launcher script: {script_name}")
     else:
-        print(f"✅ Created launcher script: {script_name}")
+        messages.append(f"✅ Created launcher script: {script_name}")
     
-    print(f"📦 Portable package created: {package_dir.absolute()}")
+    return messages
 
-def main():
+def _install_executable_into_package(package_dir):
+    """Copy the built executable into a prepared portable package"""
+    platform_info = get_platform_info()
+    
+    # Copy executable
+    exe_name = f"MissingFileScanner{platform_info.exe_extension}"
+    exe_source = Path("dist") / exe_name
+    if exe_source.exists():
+        _fastcopy(exe_source, package_dir / exe_name)
+        print(f"✅ Copied executable: {exe_name}")
+        
+        # Make executable on Unix-like systems
+        if platform_info.exe_extension == "":
+            os.chmod(package_dir / exe_name, 0o755)
+            print("✅ Set executable permissions")
+
+def _publish_package(staging_dir):
+    """Swap a fully assembled package into place of the previous one"""
+    # The old package is only moved aside once the new one is complete
+    if PACKAGE_DIR.exists():
+        _trash_dir(PACKAGE_DIR)
+    os.replace(staging_dir, PACKAGE_DIR)
+    print(f"📦 Portable package created: {PACKAGE_DIR.absolute()}")
+
+def _finish_portable_package(staging_dir, skeleton_messages):
+    """Add the built executable to a staged package skeleton and publish it"""
+    platform_info = get_platform_info()
+    print(f"📦 Creating portable package for {platform_info.name}...")
+    for message in skeleton_messages:
+        print(message)
+    _install_executable_into_package(staging_dir)
+    _publish_package(staging_dir)
+
+def create_portable_package(present=None):
+    """Create a portable package with the executable and documentation"""
+    staging_dir = _staging_package_dir()
+    _finish_portable_package(staging_dir, _prepare_package_skeleton(staging_dir, present))
+
+def main(verbose=False):
     """Main build process"""
     platform_info = get_platform_info()
     
     print(f"🚀 Missing File Scanner - Build Script")
-    print(f"{platform_info['icon']} Building for {platform_info['name']}")
+    print(f"{platform_info.icon} Building for {platform_info.name}")
     print("=" * 50)
     
     # Check if main script exists
-    if not Path("missing_file_scanner.py").exists():
+    present = _list_working_dir()
+    if "missing_file_scanner.py" not in present:
         print("❌ missing_file_scanner.py not found!")
         return False
     
@@ -193,19 +415,25 @@ def main():
     # Step 2: Clean previous builds
     clean_build_dirs()
     
-    # Step 3: Create executable
-    if not create_executable():
-        return False
+    # Step 3: Create executable, staging the portable package meanwhile.
+    # The previous package stays untouched unless the build succeeds.
+    staging_dir = _staging_package_dir()
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        build_future = executor.submit(create_executable, verbose)
+        skeleton_messages = _prepare_package_skeleton(staging_dir, present)
+        if not build_future.result():
+            shutil.rmtree(staging_dir, ignore_errors=True)
+            return False
     
-    # Step 4: Create portable package
-    create_portable_package()
+    # Step 4: Complete portable package
+    _finish_portable_package(staging_dir, skeleton_messages)
     
-    exe_name = f"MissingFileScanner{platform_info['exe_extension']}"
-    script_name = f"Run_Scanner{platform_info['script_extension']}"
+    exe_name = f"MissingFileScanner{platform_info.exe_extension}"
+    script_name = f"Run_Scanner{platform_info.script_extension}"
     
     print("\n" + "=" * 50)
     print("🎉 Build completed successfully!")
-    print(f"\nFiles created for {platform_info['name']}:")
+    print(f"\nFiles created for {platform_info.name}:")
     print(f"  📁 dist/{exe_name} - Standalone executable")
     print(f"  📁 MissingFileScanner_Portable/ - Portable package")
     print(f"  📄 MissingFileScanner_Portable/{script_name} - Launcher script")
@@ -214,7 +442,7 @@ def main():
     return True
 
 if __name__ == "__main__":
-    success = main()
+    success = main(verbose="--verbose" in sys.argv[1:])
     if not success:
         print("\n❌ Build failed!")
         sys.exit(1)
@@ -1,45 +1,214 @@
 import sys
 import os
+import re
 import subprocess
+import queue
+import time
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from PySide6.QtWidgets import (QApplication, QMainWindow, QVBoxLayout, QHBoxLayout, 
-                             QWidget, QPushButton, QLineEdit, QTextEdit, QLabel, 
+                             QWidget, QPushButton, QLineEdit, QListView, QLabel, 
                              QFileDialog, QProgressBar, QFrame, QScrollArea, QMessageBox, QMenu)
-from PySide6.QtCore import Qt, QThread, Signal, QTimer
-from PySide6.QtGui import QFont, QIcon, QPalette, QColor, QAction, QCursor
+from PySide6.QtCore import Qt, QThread, Signal, QStringListModel
+from PySide6.QtGui import QFont, QIcon, QPalette, QColor, QAction, QCursor, QPainter
+
+try:
+    import ahocorasick  # Optional: faster matching for long exclusion lists
+except ImportError:
+    ahocorasick = None
+
+# Worker threads used to list folders concurrently during a scan
+SCAN_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Missing folders are sent to the UI in batches of this size, or this often (seconds)
+RESULT_BATCH_SIZE = 64
+RESULT_BATCH_INTERVAL = 0.05
+
+# Progress is reported every this many folders
+PROGRESS_INTERVAL = 128
+
+# The progress display repaints at most this often (seconds) unless the percentage changes
+PROGRESS_PAINT_INTERVAL = 1 / 30
+
+# Folder listings kept between scans (least recently used are dropped first)
+FOLDER_CACHE_MAX_ENTRIES = 50000
+
+# Listings of folders modified less than this many seconds before they were
+# listed are not cached: on filesystems with coarse timestamps (FAT keeps
+# 2 seconds, many network shares are similar) a later change within the same
+# tick would leave the mtime unchanged
+FOLDER_CACHE_MIN_AGE = 3
+
+# How often (seconds) a running scan checks for a stop request while waiting
+INTERRUPT_POLL_INTERVAL = 0.1
+
+# Below this many exclusion terms, a regex alternation beats building an automaton
+AHOCORASICK_MIN_TERMS = 4
+
+
+def casefold_name(text):
+    """Case-fold text for case-insensitive comparison
+    
+    str.casefold() handles non-ASCII text correctly (e.g. German ß); pure
+    ASCII text takes the faster str.lower(), which gives the same result.
+    """
+    return text.lower() if text.isascii() else text.casefold()
+
+
+def walk_order_key(folder_path):
+    """Sort key that orders folders like a top-down walk: parents first, siblings by name"""
+    return casefold_name(folder_path).split(os.sep)
+
+
+class FolderListingCache:
+    """Folder listings kept between scans, reused while a folder's mtime is unchanged
+    
+    Rescanning the same tree for another file name or with other exclusions
+    then mostly costs one stat per folder instead of a full listing. Worker
+    threads share the cache, so access is serialized with a lock.
+    """
+    
+    def __init__(self, max_entries=FOLDER_CACHE_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._listings = OrderedDict()  # Folder path -> (mtime_ns, listing), oldest use first
+        self._lock = threading.Lock()
+        
+    def get(self, folder_path, mtime_ns):
+        """Return the cached listing for a folder, or None if missing or stale"""
+        with self._lock:
+            cached = self._listings.get(folder_path)
+            if cached is None or cached[0] != mtime_ns:
+                return None
+            self._listings.move_to_end(folder_path)
+            return cached[1]
+        
+    def put(self, folder_path, mtime_ns, listing):
+        """Store a folder's listing, evicting the least recently used ones over the limit"""
+        with self._lock:
+            self._listings[folder_path] = (mtime_ns, listing)
+            self._listings.move_to_end(folder_path)
+            while len(self._listings) > self.max_entries:
+                self._listings.popitem(last=False)
 
 
 class FileScannerThread(QThread):
     """Background thread for scanning directories"""
     progress_updated = Signal(int, int)  # current, total
-    folder_found = Signal(str)  # folder path where file is missing
+    folder_batch_found = Signal(list)  # folder paths where file is missing
     scan_completed = Signal(int)  # total missing count
     
-    def __init__(self, root_folder, filename, exclusion_list=None):
+    def __init__(self, root_folder, filename, exclusion_list=None, folder_cache=None, executor=None):
         super().__init__()
         self.root_folder = root_folder
         self.filename = filename
+        self._search_term = casefold_name(filename)
+        # A concrete file name (with an extension, no wildcard) is usually present verbatim
+        self._exact_name = filename if '.' in filename and '*' not in filename else None
         self.exclusion_list = exclusion_list or []
+        self._exclusions = tuple(casefold_name(term.strip()) for term in self.exclusion_list if term.strip())
+        self._is_excluded = self._build_exclusion_matcher()
+        self.folder_cache = folder_cache  # Optional FolderListingCache shared between scans
+        self.executor = executor  # Optional worker pool shared between scans
         self.missing_folders = []
         
+    def _build_exclusion_matcher(self):
+        """Build the exclusion check for this scan's terms, or None if nothing is excluded
+        
+        Choosing the strategy once here keeps the per-folder check free of
+        branches on the exclusion setup.
+        """
+        exclusions = self._exclusions
+        if not exclusions:
+            return None
+        
+        # The folder name is part of the full path, so one check covers both
+        if ahocorasick is not None and len(exclusions) >= AHOCORASICK_MIN_TERMS:
+            # Match many exclusion terms in a single pass over the path
+            automaton = ahocorasick.Automaton()
+            for exclusion in exclusions:
+                automaton.add_word(exclusion, exclusion)
+            automaton.make_automaton()
+            find_terms = automaton.iter
+            return lambda folder_path: next(find_terms(casefold_name(folder_path)), None) is not None
+        
+        if len(exclusions) == 1:
+            exclusion = exclusions[0]
+            return lambda folder_path: exclusion in casefold_name(folder_path)
+        
+        # One alternation regex scans the path in C instead of looping over terms
+        find_term = re.compile("|".join(map(re.escape, exclusions))).search
+        return lambda folder_path: find_term(casefold_name(folder_path)) is not None
+        
     def should_exclude_folder(self, folder_path):
         """Check if folder should be excluded based on exclusion list"""
-        if not self.exclusion_list:
+        return self._is_excluded is not None and self._is_excluded(folder_path)
+        
+    def folder_has_match(self, file_names):
+        """Check whether any of a folder's case-folded file names matches the search term"""
+        # Exact full filename match is a single set lookup
+        if self._search_term in file_names:
+            return True
+        
+        if not file_names:
             return False
-            
-        folder_name = os.path.basename(folder_path).lower()
-        folder_path_lower = folder_path.lower()
         
-        for exclusion_term in self.exclusion_list:
-            exclusion_lower = exclusion_term.strip().lower()
-            if not exclusion_lower:
-                continue
-                
-            # Check if exclusion term is in folder name or full path
-            if exclusion_lower in folder_name or exclusion_lower in folder_path_lower:
-                return True
-                
-        return False
+        # A partial match on the full name also covers matches on the
+        # name without its extension. File names cannot contain NUL, so
+        # one substring search over the joined names runs the whole loop in C.
+        return self._search_term in "\0".join(file_names)
+        
+    def list_folder(self, folder_path):
+        """List one folder's file names and subfolders, reusing a cached listing if unchanged"""
+        cache = self.folder_cache
+        if cache is not None:
+            # Adding, removing or renaming entries updates the folder's mtime.
+            # It is read before listing, so changes made meanwhile trigger a
+            # fresh listing next time - unless they land in the same timestamp
+            # tick, which is why recently modified folders are not cached.
+            # The stat is needed even on a cold scan, to know what to cache:
+            # one extra syscall per folder, repaid by skipped listings later.
+            mtime_ns = os.stat(folder_path).st_mtime_ns
+            listing = cache.get(folder_path, mtime_ns)
+            if listing is not None:
+                return listing
+        
+        file_names = []
+        subdirs = []
+        with os.scandir(folder_path) as entries:
+            for entry in entries:
+                # Symlinked folders are not followed, same as os.walk
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                # DirEntry caches the file type, so no extra stat per file.
+                # Only a symlink needs a stat, to see whether it points to
+                # a file - a linked file counts as the file being present.
+                elif entry.is_file(follow_symlinks=False) or (entry.is_symlink() and entry.is_file()):
+                    file_names.append(entry.name)
+        
+        listing = (frozenset(file_names), tuple(subdirs))
+        if cache is not None and time.time_ns() - mtime_ns >= FOLDER_CACHE_MIN_AGE * 1_000_000_000:
+            cache.put(folder_path, mtime_ns, listing)
+        return listing
+        
+    def scan_folder(self, folder_path):
+        """List one folder, returning its subfolders to scan and whether the file is missing"""
+        try:
+            file_names, subdirs = self.list_folder(folder_path)
+        except OSError:
+            # Skip folders we can't access
+            return None
+        
+        is_excluded = self._is_excluded
+        if is_excluded is not None:
+            subdirs = [subdir for subdir in subdirs if not is_excluded(subdir)]
+        
+        # An exact hit settles the folder without folding the names or
+        # running the partial match
+        if self._exact_name in file_names:
+            return subdirs, False
+        return subdirs, not self.folder_has_match({casefold_name(name) for name in file_names})
         
     def run(self):
         """Scan directories for missing files"""
@@ -47,64 +216,92 @@ class FileScannerThread(QThread):
             # Clear previous results
             self.missing_folders.clear()
             
-            # Get all subdirectories (avoid duplicates)
-            all_dirs = []
-            for root, dirs, files in os.walk(self.root_folder):
-                all_dirs.append(root)
-                # Don't add subdirectories here as os.walk will visit them
+            # Normalize path separators for Windows once; paths built from
+            # DirEntry.path below then already use native separators
+            root_folder = os.path.normpath(self.root_folder)
             
-            total_dirs = len(all_dirs)
+            # Excluded folders are never submitted, which skips their whole subtree
+            if self.should_exclude_folder(root_folder):
+                self.scan_completed.emit(0)
+                return
             
-            for i, folder_path in enumerate(all_dirs):
-                # Check if folder should be excluded
-                if self.should_exclude_folder(folder_path):
-                    continue
-                    
-                # Check if file exists in this folder
-                file_found = False
+            # Listing folders is I/O bound, so several are scanned concurrently.
+            # Workers only list folders; results are handled on this thread.
+            results = queue.Queue()
+            executor = self.executor or ThreadPoolExecutor(max_workers=SCAN_WORKERS)
+            in_flight = set()
+            try:
+                def submit(path):
+                    future = executor.submit(self.scan_folder, path)
+                    in_flight.add(future)
+                    future.add_done_callback(lambda done, path=path: results.put((path, done)))
+                
+                submit(root_folder)
+                pending = 1
+                dirs_processed = 0
                 
-                try:
-                    for file in os.listdir(folder_path):
-                        if os.path.isfile(os.path.join(folder_path, file)):
-                            # Get filename without extension for comparison
-                            name_without_ext = os.path.splitext(file)[0]
-                            
-                            # Check multiple matching criteria
-                            search_term = self.filename.lower()
-                            file_lower = file.lower()
-                            name_without_ext_lower = name_without_ext.lower()
-                            
-                            # 1. Exact full filename match (with extension)
-                            if file_lower == search_term:
-                                file_found = True
-                                break
-                            
-                            # 2. Exact filename match without extension
-                            if name_without_ext_lower == search_term:
-                                file_found = True
-                                break
-                            
-                            # 3. Partial match in full filename (with extension)
-                            if search_term in file_lower:
-                                file_found = True
-                                break
-                            
-                            # 4. Partial match in filename without extension
-                            if search_term in name_without_ext_lower:
-                                file_found = True
-                                break
-                                
-                except PermissionError:
-                    # Skip folders we can't access
-                    continue
+                # Batch results so the UI is not flooded with one signal per folder
+                batch = []
+                last_flush = time.monotonic()
                 
-                if not file_found:
-                    # Normalize path separators for Windows
-                    normalized_path = os.path.normpath(folder_path)
-                    self.missing_folders.append(normalized_path)
-                    self.folder_found.emit(normalized_path)
+                while pending:
+                    if self.isInterruptionRequested():
+                        return
+                    
+                    # Checked every pass, including after a timeout below, so
+                    # found folders are sent even while slow folders still list
+                    if batch and time.monotonic() - last_flush >= RESULT_BATCH_INTERVAL:
+                        self.folder_batch_found.emit(batch)
+                        batch = []
+                        last_flush = time.monotonic()
+                    
+                    # Wake up regularly so a stop request is noticed even while
+                    # a slow folder (e.g. on a network drive) is still listing
+                    try:
+                        folder_path, future = results.get(timeout=INTERRUPT_POLL_INTERVAL)
+                    except queue.Empty:
+                        continue
+                    in_flight.discard(future)
+                    pending -= 1
+                    scanned = future.result()
+                    if scanned is None:
+                        continue
+                    
+                    subdirs, missing = scanned
+                    for subdir in subdirs:
+                        submit(subdir)
+                    pending += len(subdirs)
+                    dirs_processed += 1
+                    
+                    if missing:
+                        self.missing_folders.append(folder_path)
+                        batch.append(folder_path)
+                    
+                    if len(batch) >= RESULT_BATCH_SIZE:
+                        self.folder_batch_found.emit(batch)
+                        batch = []
+                        last_flush = time.monotonic()
+                    
+                    # The total grows as new subfolders are discovered
+                    if dirs_processed % PROGRESS_INTERVAL == 0:
+                        self.progress_updated.emit(dirs_processed, dirs_processed + pending)
                 
-                self.progress_updated.emit(i + 1, total_dirs)
+                if batch:
+                    self.folder_batch_found.emit(batch)
+                self.progress_updated.emit(dirs_processed, dirs_processed)
+                
+                # Folders finish in whatever order the workers get to them;
+                # the final list is in walk order, the same on every scan
+                self.missing_folders.sort(key=walk_order_key)
+            finally:
+                # Drop our queued listings and don't block on folders still
+                # listing after a stop request. Futures are cancelled by hand
+                # because shutdown(cancel_futures=True) needs Python 3.9.
+                for future in in_flight:
+                    future.cancel()
+                # A shared pool stays up for the next scan
+                if executor is not self.executor:
+                    executor.shutdown(wait=False)
             
             self.scan_completed.emit(len(self.missing_folders))
             
@@ -193,126 +390,96 @@ class ModernLineEdit(QLineEdit):
         """)
 
 
-class ClickableTextEdit(QTextEdit):
-    """Custom QTextEdit that supports clickable folder paths and context menu"""
+class ClickableListView(QListView):
+    """Custom QListView that supports clickable folder paths and context menu"""
     
     def __init__(self):
         super().__init__()
-        self.missing_folders = []
+        # A list view only lays out and paints the visible rows, so large
+        # result sets stay cheap to append to and scroll through
+        self.folder_model = QStringListModel(self)
+        self.setModel(self.folder_model)
+        self.setEditTriggers(QListView.EditTrigger.NoEditTriggers)
+        self.setUniformItemSizes(True)  # All rows are single lines of text
         self.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.customContextMenuRequested.connect(self.show_context_menu)
         self.setMouseTracking(True)  # Enable mouse tracking for hover effects
-        self.current_hover_line = -1
-        self.cursor_override_active = False  # Track cursor override state
-        
-    def add_folder_path(self, folder_path):
-        """Add a folder path to the results and store it for context menu"""
-        self.missing_folders.append(folder_path)
-        self.append(folder_path)
+        self.current_hover_path = None
+        self._placeholder_text = ""
+        self._message = ""  # Shown instead of the placeholder, e.g. after a scan
+        
+    def setPlaceholderText(self, text):
+        """Set the text shown while there are no results"""
+        self._placeholder_text = text
+        self.viewport().update()
+        
+    def show_message(self, text):
+        """Show a message in place of the (empty) results"""
+        self._message = text
+        self.viewport().update()
+        
+    def paintEvent(self, event):
+        """Paint the rows, or the placeholder text when there are none"""
+        super().paintEvent(event)
+        text = self._message or self._placeholder_text
+        if text and self.folder_model.rowCount() == 0:
+            painter = QPainter(self.viewport())
+            painter.setPen(QColor(161, 159, 157))
+            painter.drawText(self.viewport().rect(),
+                             Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop,
+                             text)
+        
+    def add_folder_paths(self, folder_paths):
+        """Add folder paths to the results"""
+        first_row = self.folder_model.rowCount()
+        self.folder_model.insertRows(first_row, len(folder_paths))
+        for offset, folder_path in enumerate(folder_paths):
+            self.folder_model.setData(self.folder_model.index(first_row + offset), folder_path)
+        
+    def set_folder_paths(self, folder_paths):
+        """Replace the results with the given folder paths, keeping the scroll position"""
+        scroll_position = self.verticalScrollBar().value()
+        self.folder_model.setStringList(folder_paths)
+        self.verticalScrollBar().setValue(scroll_position)
         
     def clear_results(self):
-        """Clear both the text and the stored folder paths"""
-        self.clear()
-        self.missing_folders.clear()
-        self.current_hover_line = -1
-        if self.cursor_override_active:
-            QApplication.restoreOverrideCursor()
-            self.cursor_override_active = False
+        """Clear the stored folder paths and any message"""
+        self.folder_model.setStringList([])
+        self._message = ""
+        self.current_hover_path = None
+        self.viewport().unsetCursor()
+        self.setToolTip("")
+        
+    def _path_at(self, position):
+        """Return the folder path of the row at a viewport position, or None"""
+        return self.indexAt(position).data()
         
     def mouseMoveEvent(self, event):
         """Handle mouse movement for hover effects"""
-        cursor = self.cursorForPosition(event.position().toPoint())
-        cursor.select(cursor.SelectionType.LineUnderCursor)
-        selected_line = cursor.selectedText().strip()
-        
-        # Get line number
-        line_number = cursor.blockNumber()
-        
-        # Check if this line contains a valid folder path
-        is_valid_path = False
-        if selected_line:
-            # Check exact match first
-            if selected_line in self.missing_folders:
-                is_valid_path = True
+        # Rows highlight themselves on hover; only the cursor and tooltip
+        # need updating here, and only when the hovered row changes
+        hover_path = self._path_at(event.position().toPoint())
+        if hover_path != self.current_hover_path:
+            self.current_hover_path = hover_path
+            if hover_path:
+                # Change cursor to pointing hand for clickable rows
+                self.viewport().setCursor(Qt.CursorShape.PointingHandCursor)
+                self.setToolTip("Double-click to open folder in Explorer")
             else:
-                # Check if any stored folder path matches this line
-                for folder_path in self.missing_folders:
-                    if folder_path.strip() == selected_line or selected_line in folder_path:
-                        is_valid_path = True
-                        break
-        
-        if is_valid_path:
-            # Change cursor to pointing hand for clickable lines
-            if not self.cursor_override_active:
-                QApplication.setOverrideCursor(Qt.CursorShape.PointingHandCursor)
-                self.cursor_override_active = True
-            self.setToolTip("Double-click to open folder in Explorer")
-            
-            # Highlight the line if it's different from current
-            if line_number != self.current_hover_line:
-                self.highlight_line(line_number)
-                self.current_hover_line = line_number
-        else:
-            # Reset cursor and remove highlighting
-            if self.cursor_override_active:
-                QApplication.restoreOverrideCursor()
-                self.cursor_override_active = False
-            self.setToolTip("")
-            if self.current_hover_line != -1:
-                self.remove_highlighting()
-                self.current_hover_line = -1
-                
+                self.viewport().unsetCursor()
+                self.setToolTip("")
         super().mouseMoveEvent(event)
     
     def leaveEvent(self, event):
-        """Remove highlighting when mouse leaves the widget"""
-        if self.cursor_override_active:
-            QApplication.restoreOverrideCursor()
-            self.cursor_override_active = False
+        """Reset hover effects when mouse leaves the widget"""
+        self.current_hover_path = None
+        self.viewport().unsetCursor()
         self.setToolTip("")
-        if self.current_hover_line != -1:
-            self.remove_highlighting()
-            self.current_hover_line = -1
         super().leaveEvent(event)
-    
-    def highlight_line(self, line_number):
-        """Highlight a specific line"""
-        cursor = self.textCursor()
-        cursor.movePosition(cursor.MoveOperation.Start)
-        cursor.movePosition(cursor.MoveOperation.Down, cursor.MoveMode.MoveAnchor, line_number)
-        cursor.select(cursor.SelectionType.LineUnderCursor)
-        
-        # Create selection format with background color
-        selection = QTextEdit.ExtraSelection()
-        selection.format.setBackground(QColor(173, 216, 230))  # Light blue background
-        selection.format.setProperty(selection.format.Property.FullWidthSelection, True)
-        selection.cursor = cursor
-        
-        self.setExtraSelections([selection])
-    
-    def remove_highlighting(self):
-        """Remove all highlighting"""
-        self.setExtraSelections([])
         
     def show_context_menu(self, position):
         """Show context menu with option to open folder"""
-        cursor = self.textCursor()
-        cursor.select(cursor.SelectionType.LineUnderCursor)
-        selected_line = cursor.selectedText().strip()
-        
-        # Find the matching folder path
-        matching_path = None
-        if selected_line:
-            # Check exact match first
-            if selected_line in self.missing_folders:
-                matching_path = selected_line
-            else:
-                # Check if any stored folder path matches this line
-                for folder_path in self.missing_folders:
-                    if folder_path.strip() == selected_line or selected_line in folder_path:
-                        matching_path = folder_path
-                        break
-        
+        matching_path = self._path_at(position)
         if matching_path:
             menu = QMenu(self)
             
@@ -358,7 +525,7 @@ class ClickableTextEdit(QTextEdit):
             copy_action.triggered.connect(lambda: self.copy_path(matching_path))
             menu.addAction(copy_action)
             
-            menu.exec(self.mapToGlobal(position))
+            menu.exec(self.viewport().mapToGlobal(position))
     
     def open_folder(self, folder_path):
         """Open folder in Windows Explorer"""
@@ -387,23 +554,7 @@ class ClickableTextEdit(QTextEdit):
         
     def mouseDoubleClickEvent(self, event):
         """Handle double-click to open folder"""
-        cursor = self.textCursor()
-        cursor.select(cursor.SelectionType.LineUnderCursor)
-        selected_line = cursor.selectedText().strip()
-        
-        # Find the matching folder path
-        matching_path = None
-        if selected_line:
-            # Check exact match first
-            if selected_line in self.missing_folders:
-                matching_path = selected_line
-            else:
-                # Check if any stored folder path matches this line
-                for folder_path in self.missing_folders:
-                    if folder_path.strip() == selected_line or selected_line in folder_path:
-                        matching_path = folder_path
-                        break
-        
+        matching_path = self._path_at(event.position().toPoint())
         if matching_path:
             self.open_folder(matching_path)
         else:
@@ -414,6 +565,13 @@ class MissingFileScanner(QMainWindow):
     def __init__(self):
         super().__init__()
         self.scanner_thread = None
+        self.folder_cache = FolderListingCache()
+        # Worker threads are started once and reused by every scan
+        self.scan_executor = ThreadPoolExecutor(max_workers=SCAN_WORKERS)
+        self._last_pct = 0
+        self._last_progress_paint = 0.0
+        self._last_exclusion_list = []
+        self._parsed_exclusions = ()  # Kept in sync with the exclusion field
         self.init_ui()
         self.apply_modern_theme()
         
@@ -679,6 +837,7 @@ class MissingFileScanner(QMainWindow):
             }
         """)
         exclusion_column_layout.addWidget(self.exclusion_input)
+        self.exclusion_input.textChanged.connect(self._reparse_exclusions)
         
         # Add columns to horizontal layout
         inputs_row_layout.addWidget(filename_column)
@@ -764,20 +923,27 @@ class MissingFileScanner(QMainWindow):
         results_label.setStyleSheet("color: #323130;")
         main_layout.addWidget(results_label)
         
-        # Results text area (takes remaining space)
-        self.results_text = ClickableTextEdit()
+        # Results list (takes remaining space)
+        self.results_text = ClickableListView()
         self.results_text.setFont(QFont("Consolas", 10))
         self.results_text.setStyleSheet("""
-            QTextEdit {
+            QListView {
                 border: 2px solid #e1dfdd;
                 border-radius: 8px;
                 background-color: white;
                 color: #323130;
                 padding: 15px;
             }
-            QTextEdit:focus {
+            QListView:focus {
                 border-color: #0078d4;
             }
+            QListView::item:hover {
+                background-color: #add8e6;
+            }
+            QListView::item:selected {
+                background-color: #add8e6;
+                color: #323130;
+            }
         """)
         self.results_text.setPlaceholderText("Scan results will appear here...\nDouble-click any path to open in Explorer, or right-click for more options.")
         main_layout.addWidget(self.results_text, 2)  # This takes remaining space with higher priority
@@ -818,11 +984,14 @@ class MissingFileScanner(QMainWindow):
         if folder:
             self.folder_input.setText(folder)
             
+    def _reparse_exclusions(self, exclusion_text):
+        """Parse the comma-separated exclusion field into a tuple of terms"""
+        self._parsed_exclusions = tuple(term.strip() for term in exclusion_text.split(',') if term.strip())
+        
     def start_scan(self):
         """Start the file scanning process"""
         folder_path = self.folder_input.text().strip()
         filename = self.filename_input.text().strip()
-        exclusion_text = self.exclusion_input.text().strip()
         
         if not folder_path:
             QMessageBox.warning(self, "Warning", "Please select a folder to scan.")
@@ -836,10 +1005,9 @@ class MissingFileScanner(QMainWindow):
             QMessageBox.critical(self, "Error", "Selected folder does not exist.")
             return
         
-        # Parse exclusion list
-        exclusion_list = []
-        if exclusion_text:
-            exclusion_list = [term.strip() for term in exclusion_text.split(',') if term.strip()]
+        # The exclusion list is parsed whenever the field changes
+        exclusion_list = list(self._parsed_exclusions)
+        self._last_exclusion_list = exclusion_list
         
         # Clear previous results
         self.results_text.clear_results()
@@ -849,24 +1017,43 @@ class MissingFileScanner(QMainWindow):
         self.scan_button.setText("Scanning...")
         self.progress_bar.setVisible(True)
         self.progress_bar.setValue(0)  # Reset to 0 for new scan
+        self._last_pct = 0
         self.status_label.setText("Initializing scan...")
         
         # Start scanner thread
-        self.scanner_thread = FileScannerThread(folder_path, filename, exclusion_list)
+        self.scanner_thread = FileScannerThread(folder_path, filename, exclusion_list,
+                                                self.folder_cache, self.scan_executor)
         self.scanner_thread.progress_updated.connect(self.update_progress)
-        self.scanner_thread.folder_found.connect(self.add_missing_folder)
+        self.scanner_thread.folder_batch_found.connect(self.add_missing_folders)
         self.scanner_thread.scan_completed.connect(self.scan_finished)
         self.scanner_thread.start()
         
+    def closeEvent(self, event):
+        """Stop a running scan before the window closes"""
+        if self.scanner_thread is not None and self.scanner_thread.isRunning():
+            self.scanner_thread.requestInterruption()
+            self.scanner_thread.wait()
+        # The scan has already cancelled its queued listings
+        self.scan_executor.shutdown(wait=False)
+        super().closeEvent(event)
+        
     def update_progress(self, current, total):
         """Update progress bar and status"""
-        progress = int((current / total) * 100)
+        progress = current * 100 // (total or 1)
+        now = time.monotonic()
+        
+        # Skip repaints that would show the same percentage moments later
+        if progress == self._last_pct and now - self._last_progress_paint < PROGRESS_PAINT_INTERVAL:
+            return
+        self._last_pct = progress
+        self._last_progress_paint = now
+        
         self.progress_bar.setValue(progress)
         self.status_label.setText(f"Scanning... {current}/{total} folders checked")
         
-    def add_missing_folder(self, folder_path):
-        """Add a folder to the results where the file is missing"""
-        self.results_text.add_folder_path(folder_path)
+    def add_missing_folders(self, folder_paths):
+        """Add folders to the results where the file is missing"""
+        self.results_text.add_folder_paths(folder_paths)
         
     def scan_finished(self, missing_count):
         """Handle scan completion"""
@@ -874,15 +1061,17 @@ class MissingFileScanner(QMainWindow):
         self.scan_button.setText("🔍 Start Scan")
         # Keep progress bar visible at 100% - don't hide it
         
-        exclusion_text = self.exclusion_input.text().strip()
+        # Results streamed in as folders finished; show them in walk order
+        self.results_text.set_folder_paths(self.scanner_thread.missing_folders)
+        
+        # Reuse the exclusions parsed when the scan started
         exclusion_info = ""
-        if exclusion_text:
-            exclusion_list = [term.strip() for term in exclusion_text.split(',') if term.strip()]
-            exclusion_info = f"\nExcluded folders containing: {', '.join(exclusion_list)}"
+        if self._last_exclusion_list:
+            exclusion_info = f"\nExcluded folders containing: {', '.join(self._last_exclusion_list)}"
         
         if missing_count == 0:
             self.status_label.setText("✅ File found in all folders!")
-            self.results_text.setText("Great! The file was found in all scanned folders.")
+            self.results_text.show_message("Great! The file was found in all scanned folders.")
         else:
             self.status_label.setText(f"❌ File missing in {missing_count} folder(s)")
             
@@ -25,8 +25,13 @@ def create_test_structure():
         "empty_folder"
     ]
     
-    for subdir in subdirs:
-        os.makedirs(os.path.join(test_dir, subdir), exist_ok=True)
+    # The tree is fresh, so create each folder once, parents first, with a
+    # plain os.mkdir instead of os.makedirs' existence checks
+    all_dirs = {"/".join(subdir.split("/")[:depth])
+                for subdir in subdirs
+                for depth in range(1, subdir.count("/") + 2)}
+    for subdir in sorted(all_dirs, key=lambda d: d.count("/")):
+        os.mkdir(os.path.join(test_dir, subdir))
     
     # Create test files (some folders will have the target file, others won't)
     test_files = {
@@ -39,42 +44,80 @@ def create_test_structure():
         # empty_folder has no files
     }
     
+    # Write through raw file descriptors, skipping the buffered file objects
+    write_flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
     for folder, files in test_files.items():
         folder_path = os.path.join(test_dir, folder)
         for file in files:
             file_path = os.path.join(folder_path, file)
-            with open(file_path, 'w') as f:
-                f.write(f"This is {file} in {folder}")
+            fd = os.open(file_path, write_flags, 0o644)
+            try:
+                os.write(fd, f"This is {file} in {folder}".encode())
+            finally:
+                os.close(fd)
     
     return test_dir
 
-def scan_for_missing_file(root_folder, target_filename):
+def scan_for_missing_file(root_folder, target_filename, collect_paths=True):
     """
     Simulate the scanning logic from the main application
-    Returns list of folders where the target file is missing
+    Returns (count, folders) for the folders where the target file is
+    missing; folders is None when collect_paths is False
     """
-    missing_folders = []
+    missing_folders = [] if collect_paths else None
+    missing_count = 0
     
-    # Get all directories
-    for root, dirs, files in os.walk(root_folder):
+    # Work out how to match the target once, not once per folder
+    has_ext = '.' in target_filename
+    target_lower = target_filename.lower()
+    
+    # Walk the tree with os.scandir, whose entries already know their file
+    # type, so files and folders are told apart without a stat per entry
+    stack = [root_folder]
+    while stack:
+        root = stack.pop()
+        # Collect file names straight into a set, so the exact-match check
+        # below is a hash lookup instead of a scan of the whole folder
+        files = set()
+        dirs = []
+        try:
+            with os.scandir(root) as entries:
+                for entry in entries:
+                    # Symlinked folders are not followed, but a symlinked file
+                    # counts as present, same as the main application
+                    if entry.is_dir(follow_symlinks=False):
+                        dirs.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False) or (entry.is_symlink() and entry.is_file()):
+                        files.add(entry.name)
+        except OSError:
+            # Skip folders we can't access, as os.walk does
+            continue
+        
+        # Visit subfolders in listing order, same as os.walk
+        stack.extend(reversed(dirs))
+        
         # Check if target file exists in this directory
         file_found = False
         
-        if '.' in target_filename:
+        if has_ext:
             # Filename has extension, check exact match
             file_found = target_filename in files
         else:
             # Filename without extension, check for any file with that base name
             for file in files:
-                name_without_ext = os.path.splitext(file)[0]
-                if name_without_ext.lower() == target_filename.lower():
+                # rpartition is a single C-level scan; a name without a dot
+                # (or only a leading one) is its own base name
+                name_without_ext = file.rpartition('.')[0] or file
+                if name_without_ext.lower() == target_lower:
                     file_found = True
                     break
         
         if not file_found:
-            missing_folders.append(root)
+            missing_count += 1
+            if collect_paths:
+                missing_folders.append(root)
     
-    return missing_folders
+    return missing_count, missing_folders
 
 def main():
     """Run the demonstration"""
@@ -94,7 +137,7 @@ def main():
                 print(f"{subindent}{file}")
         
         print(f"\n=== Scanning for 'config.txt' ===")
-        missing_folders = scan_for_missing_file(test_dir, "config.txt")
+        _, missing_folders = scan_for_missing_file(test_dir, "config.txt")
         
         print(f"\nFolders missing 'config.txt':")
         if missing_folders:
@@ -107,7 +150,7 @@ def main():
             print("  None! File found in all folders.")
         
         print(f"\n=== Scanning for 'readme' (without extension) ===")
-        missing_folders = scan_for_missing_file(test_dir, "readme")
+        _, missing_folders = scan_for_missing_file(test_dir, "readme")
         
         print(f"\nFolders missing 'readme' files:")
         if missing_folders:
@@ -118,6 +161,11 @@ def main():
                 print(f"  - {rel_path}")
         else:
             print("  None! File found in all folders.")
+        
+        print(f"\n=== Counting folders missing 'data.csv' ===")
+        # Only the number is needed here, so skip collecting the paths
+        missing_count, _ = scan_for_missing_file(test_dir, "data.csv", collect_paths=False)
+        print(f"\n'data.csv' is missing in {missing_count} folder(s)")
             
         print(f"\n=== Demo completed successfully! ===")
         print(f"\nTo run the GUI application, use:")